@@ -9,6 +9,8 @@ from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
 import os
+import threading
+import time
 from pathlib import Path
 
 app = FastAPI(title="Mergington High School API",
@@ -78,6 +80,152 @@ activities = {
 }
 
 
+class RateWindow:
+    """Ring buffer of time buckets counting events over a sliding window"""
+
+    def __init__(self, bucket_seconds=60, num_buckets=60, clock=time.time):
+        self.bucket_seconds = bucket_seconds
+        self.num_buckets = num_buckets
+        self._clock = clock
+        self._counts = [0] * num_buckets
+        self._total = 0
+        self._latest = None
+
+    def _advance(self):
+        # Zero out buckets that fell out of the window since the last call
+        current = int(self._clock() // self.bucket_seconds)
+        if self._latest is None:
+            self._latest = current
+            return
+        if current <= self._latest:
+            return
+        start = max(self._latest + 1, current - self.num_buckets + 1)
+        for bucket in range(start, current + 1):
+            slot = bucket % self.num_buckets
+            self._total -= self._counts[slot]
+            self._counts[slot] = 0
+        self._latest = current
+
+    def record(self):
+        self._advance()
+        self._counts[self._latest % self.num_buckets] += 1
+        self._total += 1
+
+    def total(self):
+        self._advance()
+        return self._total
+
+    def series(self):
+        """Counts per bucket, oldest first"""
+        self._advance()
+        first = self._latest - self.num_buckets + 1
+        return [self._counts[(first + i) % self.num_buckets]
+                for i in range(self.num_buckets)]
+
+
+class ActivityStats:
+    """
+    Capacity aggregates kept up to date on every signup and removal.
+
+    Each update is O(1), so reading the stats never has to scan activities.
+    Contention is tracked by grouping activities on the number of spots left
+    and remembering the smallest group, which only ever moves by one.
+    """
+
+    def __init__(self, clock=time.time):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.reset({})
+
+    def reset(self, activities):
+        """Rebuild all aggregates from an activities dictionary"""
+        with self._lock:
+            self._total_enrollments = 0
+            self._total_capacity = 0
+            self._enrolled = {}
+            self._capacity = {}
+            self._fill_rates = {}
+            self._spots_left = {}
+            self._by_spots_left = {}
+            self._min_spots_left = None
+            self._signups = RateWindow(clock=self._clock)
+
+            for name, activity in activities.items():
+                enrolled = len(activity["participants"])
+                capacity = activity["max_participants"]
+                self._total_enrollments += enrolled
+                self._total_capacity += capacity
+                self._enrolled[name] = enrolled
+                self._capacity[name] = capacity
+                self._update_fill_rate(name)
+                spots_left = capacity - enrolled
+                self._spots_left[name] = spots_left
+                self._by_spots_left.setdefault(spots_left, {})[name] = None
+                if self._min_spots_left is None or spots_left < self._min_spots_left:
+                    self._min_spots_left = spots_left
+
+    def _update_fill_rate(self, name):
+        capacity = self._capacity[name]
+        self._fill_rates[name] = (self._enrolled[name] / capacity
+                                  if capacity else 0.0)
+
+    def _change_enrollment(self, name, delta):
+        self._enrolled[name] += delta
+        self._total_enrollments += delta
+        self._update_fill_rate(name)
+
+        # Move the activity to its new spots-left group
+        old = self._spots_left[name]
+        new = old - delta
+        group = self._by_spots_left[old]
+        del group[name]
+        if not group:
+            del self._by_spots_left[old]
+        self._by_spots_left.setdefault(new, {})[name] = None
+        self._spots_left[name] = new
+
+        if new < self._min_spots_left:
+            self._min_spots_left = new
+        elif old == self._min_spots_left and old not in self._by_spots_left:
+            self._min_spots_left = new
+
+    def record_signup(self, name):
+        with self._lock:
+            self._change_enrollment(name, 1)
+            self._signups.record()
+
+    def record_removal(self, name):
+        with self._lock:
+            self._change_enrollment(name, -1)
+
+    def snapshot(self):
+        with self._lock:
+            if self._min_spots_left is None:
+                most_contended = []
+            else:
+                most_contended = list(self._by_spots_left[self._min_spots_left])
+            return {
+                "total_enrollments": self._total_enrollments,
+                "total_capacity": self._total_capacity,
+                "fill_rates": dict(self._fill_rates),
+                "most_contended": {
+                    "spots_left": self._min_spots_left,
+                    "activities": most_contended
+                },
+                "signups": {
+                    "bucket_seconds": self._signups.bucket_seconds,
+                    "window_seconds": (self._signups.bucket_seconds
+                                       * self._signups.num_buckets),
+                    "total": self._signups.total(),
+                    "per_bucket": self._signups.series()
+                }
+            }
+
+
+stats = ActivityStats()
+stats.reset(activities)
+
+
 @app.get("/")
 def root():
     return RedirectResponse(url="/static/index.html")
@@ -88,6 +236,12 @@ def get_activities():
     return activities
 
 
+@app.get("/stats")
+def get_stats():
+    """Capacity analytics, served from incrementally maintained aggregates"""
+    return stats.snapshot()
+
+
 @app.post("/activities/{activity_name}/signup")
 def signup_for_activity(activity_name: str, email: str):
     """Sign up a student for an activity"""
@@ -104,6 +258,7 @@ def signup_for_activity(activity_name: str, email: str):
 
     # Add student
     activity["participants"].append(email)
+    stats.record_signup(activity_name)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -123,4 +278,5 @@ def remove_participant(activity_name: str, email: str):
 
     # Remove participant
     activity["participants"].remove(email)
+    stats.record_removal(activity_name)
     return {"message": f"Removed {email} from {activity_name}"}
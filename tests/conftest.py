@@ -4,7 +4,7 @@ Pytest configuration and shared fixtures for backend tests
 
 import pytest
 from fastapi.testclient import TestClient
-from src.app import app, activities
+from src.app import app, activities, stats
 
 
 @pytest.fixture
@@ -43,11 +43,13 @@ def test_activities():
     # Replace the global activities dict with test data
     activities.clear()
     activities.update(test_data)
+    stats.reset(activities)
     
     yield activities
     
     # Cleanup: restore original data (optional, but good practice)
     activities.clear()
+    stats.reset(activities)
 
 
 @pytest.fixture
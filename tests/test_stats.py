@@ -0,0 +1,140 @@
+"""
+Tests for capacity analytics (GET /stats and the aggregates behind it)
+"""
+
+import pytest
+from src.app import ActivityStats, RateWindow
+
+
+class FakeClock:
+    """Manually advanced clock for time-bucketed tests"""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestGetStats:
+    """Test the GET /stats endpoint"""
+
+    def test_get_stats_returns_200(self, clean_client):
+        """Test that GET /stats returns a 200 status code"""
+        response = clean_client.get("/stats")
+        assert response.status_code == 200
+
+    def test_initial_totals(self, clean_client):
+        """Test that totals reflect the existing participants"""
+        data = clean_client.get("/stats").json()
+
+        assert data["total_enrollments"] == 3
+        assert data["total_capacity"] == 18
+        assert data["fill_rates"]["Chess Club"] == pytest.approx(1 / 5)
+        assert data["fill_rates"]["Programming Class"] == pytest.approx(2 / 10)
+        assert data["fill_rates"]["Art Studio"] == 0.0
+
+    def test_initial_most_contended(self, clean_client):
+        """Test that the activity with the fewest spots left is reported"""
+        data = clean_client.get("/stats").json()
+
+        assert data["most_contended"] == {
+            "spots_left": 3,
+            "activities": ["Art Studio"]
+        }
+
+    def test_signup_updates_stats(self, clean_client):
+        """Test that signing up updates totals, fill rate and signup count"""
+        clean_client.post("/activities/Art Studio/signup?email=dave@test.edu")
+        data = clean_client.get("/stats").json()
+
+        assert data["total_enrollments"] == 4
+        assert data["fill_rates"]["Art Studio"] == pytest.approx(1 / 3)
+        assert data["most_contended"]["spots_left"] == 2
+        assert data["signups"]["total"] == 1
+        assert sum(data["signups"]["per_bucket"]) == 1
+
+    def test_removal_updates_stats(self, clean_client):
+        """Test that removing a participant updates totals and fill rate"""
+        clean_client.delete("/activities/Chess Club/participants/alice@test.edu")
+        data = clean_client.get("/stats").json()
+
+        assert data["total_enrollments"] == 2
+        assert data["fill_rates"]["Chess Club"] == 0.0
+        assert data["signups"]["total"] == 0
+
+    def test_failed_signup_does_not_update_stats(self, clean_client):
+        """Test that a rejected duplicate signup leaves the stats unchanged"""
+        clean_client.post("/activities/Chess Club/signup?email=alice@test.edu")
+        data = clean_client.get("/stats").json()
+
+        assert data["total_enrollments"] == 3
+        assert data["signups"]["total"] == 0
+
+
+class TestActivityStats:
+    """Test the incrementally maintained aggregates directly"""
+
+    @pytest.fixture
+    def activity_stats(self):
+        activity_stats = ActivityStats()
+        activity_stats.reset({
+            "A": {"max_participants": 3, "participants": ["x"]},
+            "B": {"max_participants": 3, "participants": ["y"]},
+            "C": {"max_participants": 5, "participants": []}
+        })
+        return activity_stats
+
+    def test_ties_are_all_reported(self, activity_stats):
+        """Test that every activity sharing the fewest spots is listed"""
+        contended = activity_stats.snapshot()["most_contended"]
+        assert contended["spots_left"] == 2
+        assert set(contended["activities"]) == {"A", "B"}
+
+    def test_contention_follows_signups_and_removals(self, activity_stats):
+        """Test that the most contended group tracks changes in both directions"""
+        activity_stats.record_signup("A")
+        assert activity_stats.snapshot()["most_contended"] == {
+            "spots_left": 1, "activities": ["A"]
+        }
+
+        activity_stats.record_removal("A")
+        contended = activity_stats.snapshot()["most_contended"]
+        assert contended["spots_left"] == 2
+        assert set(contended["activities"]) == {"A", "B"}
+
+        activity_stats.record_removal("A")
+        activity_stats.record_removal("B")
+        assert activity_stats.snapshot()["most_contended"] == {
+            "spots_left": 3, "activities": ["A", "B"]
+        }
+
+    def test_empty_stats(self):
+        """Test the snapshot when there are no activities"""
+        data = ActivityStats().snapshot()
+        assert data["total_enrollments"] == 0
+        assert data["most_contended"] == {"spots_left": None, "activities": []}
+
+
+class TestRateWindow:
+    """Test the time-bucketed ring buffer"""
+
+    def test_events_expire_after_window(self):
+        """Test that events drop out once their bucket leaves the window"""
+        clock = FakeClock()
+        window = RateWindow(bucket_seconds=10, num_buckets=3, clock=clock)
+
+        window.record()
+        clock.now = 10
+        window.record()
+        window.record()
+        assert window.total() == 3
+        assert window.series() == [0, 1, 2]
+
+        clock.now = 30
+        assert window.total() == 2
+        assert window.series() == [2, 0, 0]
+
+        clock.now = 100
+        assert window.total() == 0
+        assert window.series() == [0, 0, 0]